@@ -24,9 +24,6 @@ module;
     #include <omp.h>
 #endif
 
-// C++ headers needed for module purview
-#include <sstream>
-
 // Structural indexing for ondemand parsing (SIMD tape builder)
 #include "fastjson_simd_index.h"
 
@@ -39,6 +36,48 @@ module;
 
 namespace fastjson::detail {
 
+// Scalar string end: first unescaped quote or control char in [ptr, end).
+// Shared by the SIMD dispatcher fallback and the SIMD-disabled build.
+inline auto find_string_end_scalar(const char* ptr, const char* end) -> const char* {
+    while (ptr < end) {
+        unsigned char c = static_cast<unsigned char>(*ptr);
+        if (c == '"' || c < 0x20) return ptr;
+        if (c == '\\') {
+            if (end - ptr < 2) return end;
+            if (static_cast<unsigned char>(ptr[1]) < 0x20) return ptr + 1;
+            ptr += 2;
+            continue;
+        }
+        ++ptr;
+    }
+    return end;
+}
+
+// Scalar whitespace skip: SWAR over 8-byte words, then byte-at-a-time for the tail.
+// Each byte is compared against ' ', '\t', '\n', '\r' with the exact (carry-free)
+// zero-byte test, so no per-byte branches are taken inside long indentation runs.
+inline auto skip_whitespace_scalar(const char* ptr, const char* end) -> const char* {
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+    constexpr uint64_t low7 = 0x7F7F7F7F7F7F7F7FULL;
+    constexpr uint64_t high = 0x8080808080808080ULL;
+    constexpr uint64_t ones = 0x0101010101010101ULL;
+    // High bit of each byte set iff that byte of x is zero
+    auto zero_bytes = [](uint64_t x) -> uint64_t { return ~(((x & low7) + low7) | x) & high; };
+
+    while (end - ptr >= 8) {
+        uint64_t w;
+        std::memcpy(&w, ptr, sizeof(w));
+        uint64_t ws = zero_bytes(w ^ (ones * ' ')) | zero_bytes(w ^ (ones * '\t')) |
+                      zero_bytes(w ^ (ones * '\n')) | zero_bytes(w ^ (ones * '\r'));
+        uint64_t non_ws = ~ws & high;
+        if (non_ws != 0) return ptr + (__builtin_ctzll(non_ws) >> 3);
+        ptr += 8;
+    }
+#endif
+    while (ptr < end && (*ptr == ' ' || *ptr == '\t' || *ptr == '\n' || *ptr == '\r')) ++ptr;
+    return ptr;
+}
+
 #ifdef FASTJSON_ENABLE_SIMD
 
 #if defined(__x86_64__) || defined(_M_X64)
@@ -162,7 +201,7 @@ inline auto skip_whitespace_avx512(const char* data, size_t size) -> const char*
 // AVX2 Whitespace Skip — 8x ymm registers (256 bytes per iteration)
 // --------------------------------------------------------------------------
 #ifdef HAVE_AVX2
-__attribute__((target("avx2")))
+__attribute__((hot, target("avx2")))
 inline auto skip_whitespace_avx2(const char* data, size_t size) -> const char* {
     const char* ptr = data;
     const char* end = data + size;
@@ -357,72 +396,68 @@ inline auto skip_whitespace_simd_impl(const char* data, size_t size) -> const ch
 #endif
 
     // Scalar fallback
-    const char* ptr = data;
-    const char* end = data + size;
-    while (ptr < end && (*ptr == ' ' || *ptr == '\t' || *ptr == '\n' || *ptr == '\r')) ++ptr;
-    return ptr;
+    return skip_whitespace_scalar(data, data + size);
 }
 
 // --------------------------------------------------------------------------
-// AVX2 String End Detection — 8x ymm registers (256 bytes per iteration)
-// Finds the first quote, backslash, or control char in [start, end).
+// AVX2 String End Detection — 2x ymm registers (64 bytes per iteration)
+// Finds the first unescaped quote or control char in [start, end), where start
+// is just past the opening quote. Backslash runs are resolved in-register with
+// the simdjson odd-length-sequence trick, so escapes no longer stop the scan.
 // --------------------------------------------------------------------------
 #ifdef HAVE_AVX2
-__attribute__((target("avx2")))
+__attribute__((hot, target("avx2")))
 inline auto find_string_end_avx2(const char* start, const char* end) -> const char* {
     const char* ptr = start;
 
     const __m256i quote     = _mm256_set1_epi8('"');
     const __m256i backslash = _mm256_set1_epi8('\\');
-    const __m256i ctrl_limit = _mm256_set1_epi8(0x20);
-    const __m256i sign_flip = _mm256_set1_epi8(static_cast<char>(0x80));
-
-    auto check_special = [&](__m256i chunk) -> uint32_t {
-        __m256i q  = _mm256_cmpeq_epi8(chunk, quote);
-        __m256i bs = _mm256_cmpeq_epi8(chunk, backslash);
-        // Control chars: unsigned < 0x20, use signed comparison with XOR trick
-        __m256i ctrl = _mm256_cmpgt_epi8(ctrl_limit,
-                       _mm256_xor_si256(chunk, sign_flip));
-        return static_cast<uint32_t>(_mm256_movemask_epi8(
-            _mm256_or_si256(_mm256_or_si256(q, bs), ctrl)));
-    };
+    const __m256i ctrl_max  = _mm256_set1_epi8(0x1F);
 
-    // 8x ymm multi-register: 256 bytes per iteration
-    while (ptr + 256 <= end) {
-        __m256i c0 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr));
-        __m256i c1 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr + 32));
-        __m256i c2 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr + 64));
-        __m256i c3 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr + 96));
-        __m256i c4 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr + 128));
-        __m256i c5 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr + 160));
-        __m256i c6 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr + 192));
-        __m256i c7 = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr + 224));
+    // Carry: the first byte of the next block is escaped by a trailing backslash
+    uint64_t prev_escaped = 0;
 
-        uint32_t m0 = check_special(c0); if (m0) return ptr + __builtin_ctz(m0);
-        uint32_t m1 = check_special(c1); if (m1) return ptr + 32 + __builtin_ctz(m1);
-        uint32_t m2 = check_special(c2); if (m2) return ptr + 64 + __builtin_ctz(m2);
-        uint32_t m3 = check_special(c3); if (m3) return ptr + 96 + __builtin_ctz(m3);
-        uint32_t m4 = check_special(c4); if (m4) return ptr + 128 + __builtin_ctz(m4);
-        uint32_t m5 = check_special(c5); if (m5) return ptr + 160 + __builtin_ctz(m5);
-        uint32_t m6 = check_special(c6); if (m6) return ptr + 192 + __builtin_ctz(m6);
-        uint32_t m7 = check_special(c7); if (m7) return ptr + 224 + __builtin_ctz(m7);
+    auto scan_block = [&](const char* block) -> uint64_t {
+        __m256i lo = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(block));
+        __m256i hi = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(block + 32));
 
-        ptr += 256;
-    }
+        auto mask64 = [](__m256i a, __m256i b) -> uint64_t {
+            return static_cast<uint32_t>(_mm256_movemask_epi8(a))
+                 | (static_cast<uint64_t>(static_cast<uint32_t>(_mm256_movemask_epi8(b))) << 32);
+        };
 
-    // Single ymm tail loop
-    while (ptr + 32 <= end) {
-        __m256i chunk = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(ptr));
-        uint32_t mask = check_special(chunk);
-        if (mask) return ptr + __builtin_ctz(mask);
-        ptr += 32;
+        uint64_t quotes = mask64(_mm256_cmpeq_epi8(lo, quote), _mm256_cmpeq_epi8(hi, quote));
+        uint64_t bs = mask64(_mm256_cmpeq_epi8(lo, backslash), _mm256_cmpeq_epi8(hi, backslash));
+        // Unsigned c <= 0x1F  <=>  min(c, 0x1F) == c
+        uint64_t ctrl = mask64(_mm256_cmpeq_epi8(_mm256_min_epu8(lo, ctrl_max), lo),
+                               _mm256_cmpeq_epi8(_mm256_min_epu8(hi, ctrl_max), hi));
+
+        // Escaped bits: every odd position inside a backslash run (simdjson find_escaped)
+        constexpr uint64_t even_bits = 0x5555555555555555ULL;
+        bs &= ~prev_escaped;
+        uint64_t follows_escape = (bs << 1) | prev_escaped;
+        uint64_t odd_starts = bs & ~even_bits & ~follows_escape;
+        uint64_t even_sequences;
+        prev_escaped = __builtin_uaddll_overflow(odd_starts, bs,
+                           reinterpret_cast<unsigned long long*>(&even_sequences)) ? 1 : 0;
+        uint64_t escaped = (even_bits ^ (even_sequences << 1)) & follows_escape;
+
+        return (quotes & ~escaped) | ctrl;
+    };
+
+    while (ptr + 64 <= end) {
+        uint64_t stop = scan_block(ptr);
+        if (stop) return ptr + __builtin_ctzll(stop);
+        ptr += 64;
     }
 
-    // Scalar tail
-    while (ptr < end) {
-        if (*ptr == '"' || *ptr == '\\' || static_cast<unsigned char>(*ptr) < 0x20)
-            return ptr;
-        ++ptr;
+    // Tail: pad with spaces (neither quote, backslash nor control) and scan once more
+    if (ptr < end) {
+        alignas(32) char tail[64];
+        std::memset(tail, ' ', sizeof(tail));
+        std::memcpy(tail, ptr, static_cast<size_t>(end - ptr));
+        uint64_t stop = scan_block(tail);
+        if (stop) return ptr + __builtin_ctzll(stop);
     }
     return end;
 }
@@ -440,10 +475,7 @@ inline auto find_string_end_simd_impl(const char* start, const char* end) -> con
 #endif
 
     // Scalar fallback
-    const char* ptr = start;
-    while (ptr < end && *ptr != '"' && *ptr != '\\' && static_cast<unsigned char>(*ptr) >= 0x20)
-        ++ptr;
-    return ptr;
+    return find_string_end_scalar(start, end);
 }
 
 // --------------------------------------------------------------------------
@@ -629,17 +661,11 @@ constexpr uint32_t SIMD_AMX_INT8    = 0x4000;
 inline auto detect_simd_capabilities() noexcept -> uint32_t { return 0; }
 
 inline auto skip_whitespace_simd_impl(const char* data, size_t size) -> const char* {
-    const char* ptr = data;
-    const char* end = data + size;
-    while (ptr < end && (*ptr == ' ' || *ptr == '\t' || *ptr == '\n' || *ptr == '\r')) ++ptr;
-    return ptr;
+    return skip_whitespace_scalar(data, data + size);
 }
 
 inline auto find_string_end_simd_impl(const char* start, const char* end) -> const char* {
-    const char* ptr = start;
-    while (ptr < end && *ptr != '"' && *ptr != '\\' && static_cast<unsigned char>(*ptr) >= 0x20)
-        ++ptr;
-    return ptr;
+    return find_string_end_scalar(start, end);
 }
 
 inline auto find_escape_position_simd_impl(const char* ptr, const char* end) -> const char* {
@@ -718,9 +744,8 @@ struct json_error {
 
     // String conversion for debugging
     auto to_string() const -> std::string {
-        std::ostringstream oss;
-        oss << "JSON Error at line " << line << ", column " << column << ": " << message;
-        return oss.str();
+        return "JSON Error at line " + std::to_string(line) + ", column " + std::to_string(column) +
+               ": " + message;
     }
 };
 
@@ -850,6 +875,8 @@ private:
         -> void;
     auto serialize_object_to_buffer(std::string& buffer, const json_object& obj, int indent) const
         -> void;
+    auto stream_to_buffer(std::string& buffer, const std::function<void(std::string_view)>& sink,
+                          size_t chunk_size) const -> void;
 
 public:
     // Constructors
@@ -957,8 +984,14 @@ public:
     auto to_string() const -> std::string;
     auto to_pretty_string(int indent = 4) const -> std::string;
 
+    // Streaming serialization: compact output is handed to `sink` in chunks of
+    // roughly `chunk_size` bytes, so the document is never held in one string
+    auto write_to(const std::function<void(std::string_view)>& sink,
+                  size_t chunk_size = 16384) const -> void;
+
 private:
     // Private helper methods for serialization
+    auto estimate_serialized_size() const noexcept -> size_t;
     auto serialize_pretty_to_buffer(std::string& buffer, int indent_size, int current_indent) const
         -> void;
     auto serialize_pretty_array(std::string& buffer, const json_array& arr, int indent_size,
@@ -1364,7 +1397,9 @@ auto json_value::operator[](const std::string& key) const -> const json_value& {
 auto json_value::to_string() const -> std::string {
     thread_local std::string buffer;  // Thread-local buffer for performance
     buffer.clear();
-    buffer.reserve(1024);  // Pre-allocate reasonable size
+    // Size the buffer up front so large documents don't pay for geometric regrowth
+    size_t estimate = estimate_serialized_size();
+    buffer.reserve(std::max<size_t>(1024, estimate + estimate / 4));
 
     serialize_to_buffer(buffer, 0);
     return buffer;
@@ -1379,6 +1414,85 @@ auto json_value::to_pretty_string(int indent) const -> std::string {
     return buffer;
 }
 
+auto json_value::write_to(const std::function<void(std::string_view)>& sink,
+                          size_t chunk_size) const -> void {
+    std::string buffer;
+    buffer.reserve(chunk_size + 256);
+
+    stream_to_buffer(buffer, sink, chunk_size);
+    if (!buffer.empty()) {
+        sink(buffer);
+    }
+}
+
+// Same output as serialize_to_buffer, but flushes to the sink between container elements
+auto json_value::stream_to_buffer(std::string& buffer,
+                                  const std::function<void(std::string_view)>& sink,
+                                  size_t chunk_size) const -> void {
+    auto flush_if_full = [&] {
+        if (buffer.size() >= chunk_size) {
+            sink(buffer);
+            buffer.clear();
+        }
+    };
+
+    if (const auto* arr = std::get_if<json_array_ptr>(&data_)) {
+        buffer += '[';
+        for (size_t i = 0; i < (*arr)->size(); ++i) {
+            if (i > 0)
+                buffer += ',';
+            (**arr)[i].stream_to_buffer(buffer, sink, chunk_size);
+            flush_if_full();
+        }
+        buffer += ']';
+    } else if (const auto* obj = std::get_if<json_object_ptr>(&data_)) {
+        buffer += '{';
+        bool first = true;
+        for (const auto& [key, value] : **obj) {
+            if (!first)
+                buffer += ',';
+            first = false;
+
+            serialize_string_to_buffer(buffer, key);
+            buffer += ':';
+            value.stream_to_buffer(buffer, sink, chunk_size);
+            flush_if_full();
+        }
+        buffer += '}';
+    } else {
+        serialize_to_buffer(buffer, 0);
+    }
+}
+
+// Cheap upper-ish bound on compact output size (escapes are not counted)
+auto json_value::estimate_serialized_size() const noexcept -> size_t {
+    return std::visit(
+        [](const auto& v) -> size_t {
+            using T = std::decay_t<decltype(v)>;
+
+            if constexpr (std::is_same_v<T, std::nullptr_t> || std::is_same_v<T, bool>) {
+                return 5;
+            } else if constexpr (std::is_same_v<T, json_string_data>) {
+                return v.view().size() + 2;
+            } else if constexpr (std::is_same_v<T, json_array_ptr>) {
+                size_t total = 2 + v->size();  // brackets + commas
+                for (const auto& element : *v) {
+                    total += element.estimate_serialized_size();
+                }
+                return total;
+            } else if constexpr (std::is_same_v<T, json_object_ptr>) {
+                size_t total = 2 + v->size() * 4;  // braces + quotes, colon, comma
+                for (const auto& [key, value] : *v) {
+                    total += key.size() + value.estimate_serialized_size();
+                }
+                return total;
+            } else {
+                return 16;  // numbers
+            }
+        },
+        data_);
+}
+
 // Thread-safe internal serialization methods
 auto json_value::serialize_to_buffer(std::string& buffer, int indent) const -> void {
     std::visit(
@@ -1391,6 +1505,16 @@ auto json_value::serialize_to_buffer(std::string& buffer, int indent) const -> v
                 buffer += v ? "true" : "false";
             } else if constexpr (std::is_same_v<T, double>) {
                 thread_local std::array<char, 32> num_buffer;
+                // Integral doubles skip the shortest-round-trip search entirely
+                // (-0.0 stays on the double path so its sign survives)
+                if (std::abs(v) < 9.2e18 && v == static_cast<double>(static_cast<int64_t>(v)) &&
+                    !(v == 0.0 && std::signbit(v))) {
+                    auto [ptr, ec] = std::to_chars(num_buffer.data(),
+                                                   num_buffer.data() + num_buffer.size(),
+                                                   static_cast<int64_t>(v));
+                    buffer.append(num_buffer.data(), ptr);
+                    return;
+                }
                 auto [ptr, ec] =
                     std::to_chars(num_buffer.data(), num_buffer.data() + num_buffer.size(), v);
                 if (ec == std::errc{}) {
@@ -1409,13 +1533,22 @@ auto json_value::serialize_to_buffer(std::string& buffer, int indent) const -> v
                     buffer.append(num_buffer.data(), ptr);
                 }
             } else if constexpr (std::is_same_v<T, __int128>) {
+                thread_local std::array<char, 64> num_buffer;
+                char* end = num_buffer.data() + num_buffer.size();
+                // Integers are stored as __int128; values that fit in 64 bits
+                // avoid the 128-bit division libcall per digit
+                if (v >= std::numeric_limits<int64_t>::min() &&
+                    v <= std::numeric_limits<int64_t>::max()) {
+                    auto [ptr, ec] =
+                        std::to_chars(num_buffer.data(), end, static_cast<int64_t>(v));
+                    buffer.append(num_buffer.data(), ptr);
+                    return;
+                }
                 // Convert __int128 to string manually
                 bool is_negative = v < 0;
                 unsigned __int128 abs_val = is_negative ? -static_cast<unsigned __int128>(v)
                                                         : static_cast<unsigned __int128>(v);
-                thread_local std::array<char, 64> num_buffer;
-                char* ptr = num_buffer.data() + num_buffer.size();
-                *--ptr = '\0';
+                char* ptr = end;
                 do {
                     *--ptr = '0' + (abs_val % 10);
                     abs_val /= 10;
@@ -1423,18 +1556,24 @@ auto json_value::serialize_to_buffer(std::string& buffer, int indent) const -> v
                 if (is_negative) {
                     *--ptr = '-';
                 }
-                buffer += ptr;
+                buffer.append(ptr, end);
             } else if constexpr (std::is_same_v<T, unsigned __int128>) {
+                thread_local std::array<char, 64> num_buffer;
+                char* end = num_buffer.data() + num_buffer.size();
+                if (v <= std::numeric_limits<uint64_t>::max()) {
+                    auto [ptr, ec] =
+                        std::to_chars(num_buffer.data(), end, static_cast<uint64_t>(v));
+                    buffer.append(num_buffer.data(), ptr);
+                    return;
+                }
                 // Convert unsigned __int128 to string manually
                 unsigned __int128 val = v;
-                thread_local std::array<char, 64> num_buffer;
-                char* ptr = num_buffer.data() + num_buffer.size();
-                *--ptr = '\0';
+                char* ptr = end;
                 do {
                     *--ptr = '0' + (val % 10);
                     val /= 10;
                 } while (val > 0);
-                buffer += ptr;
+                buffer.append(ptr, end);
             } else if constexpr (std::is_same_v<T, json_string_data>) {
                 serialize_string_to_buffer(buffer, v.view());
             } else if constexpr (std::is_same_v<T, json_array_ptr>) {
@@ -1567,7 +1706,7 @@ auto json_value::serialize_pretty_array(std::string& buffer, const json_array& a
     current_indent += indent_size;
 
     for (size_t i = 0; i < arr.size(); ++i) {
-        buffer += std::string(current_indent, ' ');
+        buffer.append(static_cast<size_t>(current_indent), ' ');
         arr[i].serialize_pretty_to_buffer(buffer, indent_size, current_indent);
 
         if (i < arr.size() - 1) {
@@ -1577,7 +1716,8 @@ auto json_value::serialize_pretty_array(std::string& buffer, const json_array& a
     }
 
     current_indent -= indent_size;
-    buffer += std::string(current_indent, ' ') + ']';
+    buffer.append(static_cast<size_t>(current_indent), ' ');
+    buffer += ']';
 }
 
 auto json_value::serialize_pretty_object(std::string& buffer, const json_object& obj,
@@ -1592,7 +1732,7 @@ auto json_value::serialize_pretty_object(std::string& buffer, const json_object&
 
     auto it = obj.begin();
     while (it != obj.end()) {
-        buffer += std::string(current_indent, ' ');
+        buffer.append(static_cast<size_t>(current_indent), ' ');
         serialize_string_to_buffer(buffer, it->first);
         buffer += ": ";
         it->second.serialize_pretty_to_buffer(buffer, indent_size, current_indent);
@@ -1605,7 +1745,8 @@ auto json_value::serialize_pretty_object(std::string& buffer, const json_object&
     }
 
     current_indent -= indent_size;
-    buffer += std::string(current_indent, ' ') + '}';
+    buffer.append(static_cast<size_t>(current_indent), ' ');
+    buffer += '}';
 }
 
 // Number Precision Analysis for Adaptive Parsing
@@ -1827,14 +1968,14 @@ private:
     auto parse_boolean() -> json_result<json_value>;
     auto parse_number() -> json_result<json_value>;
     auto parse_string() -> json_result<json_value>;
-    auto parse_array() -> json_result<json_value>;
-    auto parse_object() -> json_result<json_value>;
+    auto parse_member_key() -> json_result<std::string>;
 
     // Helper methods
     auto skip_whitespace() -> void;
     auto skip_whitespace_simd() -> const char*;
     auto find_string_end_simd(const char* start) -> const char*;
     auto parse_string_simd() -> json_result<json_string_data>;
+    auto parse_key() -> json_result<std::string>;
     auto peek() const noexcept -> char;
     auto advance() noexcept -> char;
     auto match(char expected) noexcept -> bool;
@@ -1845,13 +1986,21 @@ private:
     [[nodiscard]] auto make_array_ptr(json_array&& arr) -> json_array_ptr;
     [[nodiscard]] auto make_object_ptr(json_object&& obj) -> json_object_ptr;
 
+    // One open container on the explicit parse stack
+    struct parse_frame {
+        bool is_object;
+        json_array array;
+        json_object object;
+        std::string key;  // Pending member key (objects only)
+    };
+
     // Member variables
     const char* data_;
     const char* end_;
     const char* current_;
     size_t line_;
     size_t column_;
-    size_t depth_;
+    std::vector<parse_frame> stack_;  // Open containers; size() is the nesting depth
     std::pmr::memory_resource* arena_ = nullptr;  // nullptr = use default heap
     static constexpr size_t max_depth_ = 1000;
 };
@@ -1892,11 +2041,11 @@ public:
 
 parser::parser(std::string_view input)
     : data_(input.data()), end_(input.data() + input.size()), current_(input.data()), line_(1),
-      column_(1), depth_(0), arena_(nullptr) {}
+      column_(1), arena_(nullptr) {}
 
 parser::parser(std::string_view input, std::pmr::memory_resource* arena)
     : data_(input.data()), end_(input.data() + input.size()), current_(input.data()), line_(1),
-      column_(1), depth_(0), arena_(arena) {}
+      column_(1), arena_(arena) {}
 
 auto parser::make_array_ptr(json_array&& arr) -> json_array_ptr {
     if (arena_) {
@@ -1934,49 +2083,152 @@ auto parser::parse() -> json_result<json_value> {
     return result;
 }
 
+// Iterative descent: containers live on stack_ instead of the call stack, so
+// nesting costs one parse_frame rather than a recursive call chain.
 auto parser::parse_value() -> json_result<json_value> {
-    if (depth_ >= max_depth_) {
+    stack_.clear();
+    stack_.reserve(32);
+
+    json_value value;
+
+    while (true) {
+        // ---- Parse the start of a value -----------------------------------
+        if (stack_.size() >= max_depth_) {
+            return std::unexpected(
+                make_error(json_error_code::max_depth_exceeded, "Maximum nesting depth exceeded"));
+        }
+
+        skip_whitespace();
+
+        if (is_at_end()) {
+            return std::unexpected(
+                make_error(json_error_code::unexpected_end, "Unexpected end of input"));
+        }
+
+        char c = peek();
+        json_result<json_value> scalar;
+
+        switch (c) {
+            case '[':
+                advance();
+                skip_whitespace();
+                if (match(']')) {
+                    scalar = json_value{make_array_ptr(json_array{})};
+                    break;
+                }
+                stack_.push_back(parse_frame{false, {}, {}, {}});
+                continue;
+            case '{': {
+                advance();
+                skip_whitespace();
+                if (match('}')) {
+                    scalar = json_value{make_object_ptr(json_object{})};
+                    break;
+                }
+                auto key = parse_member_key();
+                if (!key) {
+                    return std::unexpected(key.error());
+                }
+                stack_.push_back(parse_frame{true, {}, {}, std::move(*key)});
+                continue;
+            }
+            case 'n':
+                scalar = parse_null();
+                break;
+            case 't':
+            case 'f':
+                scalar = parse_boolean();
+                break;
+            case '"':
+                scalar = parse_string();
+                break;
+            case '-':
+            case '0':
+            case '1':
+            case '2':
+            case '3':
+            case '4':
+            case '5':
+            case '6':
+            case '7':
+            case '8':
+            case '9':
+                scalar = parse_number();
+                break;
+            default:
+                return std::unexpected(make_error(json_error_code::invalid_syntax,
+                                                  "Unexpected character: " + std::string(1, c)));
+        }
+
+        if (!scalar) {
+            return scalar;
+        }
+        value = std::move(*scalar);
+
+        // ---- Attach the completed value, closing finished containers ------
+        while (true) {
+            if (stack_.empty()) {
+                return value;
+            }
+
+            parse_frame& top = stack_.back();
+            if (top.is_object) {
+                // Last duplicate wins, matching operator[] semantics without default-constructing
+                top.object.insert_or_assign(std::move(top.key), std::move(value));
+            } else {
+                top.array.emplace_back(std::move(value));
+            }
+
+            skip_whitespace();
+
+            if (match(',')) {
+                skip_whitespace();
+                if (top.is_object) {
+                    auto key = parse_member_key();
+                    if (!key) {
+                        return std::unexpected(key.error());
+                    }
+                    top.key = std::move(*key);
+                }
+                break;  // Parse the next element / member value
+            }
+
+            if (top.is_object ? match('}') : match(']')) {
+                value = top.is_object ? json_value{make_object_ptr(std::move(top.object))}
+                                      : json_value{make_array_ptr(std::move(top.array))};
+                stack_.pop_back();
+                continue;
+            }
+
+            return std::unexpected(make_error(json_error_code::invalid_syntax,
+                                              top.is_object ? "Expected ',' or '}' in object"
+                                                            : "Expected ',' or ']' in array"));
+        }
+    }
+}
+
+// Parses `"key" :` at the start of an object member
+auto parser::parse_member_key() -> json_result<std::string> {
+    skip_whitespace();
+
+    if (peek() != '"') {
         return std::unexpected(
-            make_error(json_error_code::max_depth_exceeded, "Maximum nesting depth exceeded"));
+            make_error(json_error_code::invalid_syntax, "Expected string key in object"));
+    }
+
+    auto key = parse_key();
+    if (!key) {
+        return key;
     }
 
     skip_whitespace();
 
-    if (is_at_end()) {
+    if (!match(':')) {
         return std::unexpected(
-            make_error(json_error_code::unexpected_end, "Unexpected end of input"));
-    }
-
-    char c = peek();
-
-    switch (c) {
-        case 'n':
-            return parse_null();
-        case 't':
-        case 'f':
-            return parse_boolean();
-        case '"':
-            return parse_string();
-        case '[':
-            return parse_array();
-        case '{':
-            return parse_object();
-        case '-':
-        case '0':
-        case '1':
-        case '2':
-        case '3':
-        case '4':
-        case '5':
-        case '6':
-        case '7':
-        case '8':
-        case '9':
-            return parse_number();
-        default:
-            return std::unexpected(make_error(json_error_code::invalid_syntax,
-                                              "Unexpected character: " + std::string(1, c)));
+            make_error(json_error_code::invalid_syntax, "Expected ':' after object key"));
     }
+
+    return key;
 }
 
 auto parser::parse_null() -> json_result<json_value> {
@@ -2008,6 +2260,8 @@ auto parser::parse_boolean() -> json_result<json_value> {
 auto parser::parse_number() -> json_result<json_value> {
     const char* start = current_;
 
+    bool is_integer = true;  // No fraction or exponent seen
+
     // Handle negative sign
     if (peek() == '-') {
         advance();
@@ -2028,6 +2282,7 @@ auto parser::parse_number() -> json_result<json_value> {
 
     // Handle fractional part
     if (peek() == '.') {
+        is_integer = false;
         advance();
         if (!(peek() >= '0' && peek() <= '9')) {
             return std::unexpected(
@@ -2040,6 +2295,7 @@ auto parser::parse_number() -> json_result<json_value> {
 
     // Handle exponent
     if (peek() == 'e' || peek() == 'E') {
+        is_integer = false;
         advance();
         if (peek() == '+' || peek() == '-') {
             advance();
@@ -2052,6 +2308,19 @@ auto parser::parse_number() -> json_result<json_value> {
         }
     }
 
+    // Integer fast path: exact int64 parse, no strtod / to_chars round-trip.
+    // Magnitudes up to 2^53 are exactly representable, so the stored double is
+    // identical to what the general path produces. "-0" keeps its sign via strtod.
+    if (is_integer) {
+        int64_t int_value = 0;
+        auto [ptr, ec] = std::from_chars(start, current_, int_value);
+        constexpr int64_t max_exact = int64_t{1} << 53;
+        if (ec == std::errc{} && ptr == current_ && int_value >= -max_exact &&
+            int_value <= max_exact && !(int_value == 0 && *start == '-')) {
+            return json_value{static_cast<double>(int_value)};
+        }
+    }
+
     // Analyze precision requirements
     size_t length = current_ - start;
     auto precision_info = analyze_number_precision(start, current_);
@@ -2247,121 +2516,6 @@ auto parser::parse_string() -> json_result<json_value> {
     return json_value{std::move(value)};
 }
 
-auto parser::parse_array() -> json_result<json_value> {
-    if (!match('[')) {
-        return std::unexpected(make_error(json_error_code::invalid_syntax, "Expected '['"));
-    }
-
-    ++depth_;
-    json_array array;
-
-    skip_whitespace();
-
-    // Handle empty array
-    if (match(']')) {
-        --depth_;
-        return json_value{make_array_ptr(std::move(array))};
-    }
-
-    // Parse array elements
-    while (true) {
-        auto element = parse_value();
-        if (!element) {
-            --depth_;
-            return std::unexpected(element.error());
-        }
-
-        array.emplace_back(std::move(*element));
-
-        skip_whitespace();
-
-        if (match(']')) {
-            break;
-        } else if (match(',')) {
-            skip_whitespace();
-            continue;
-        } else {
-            --depth_;
-            return std::unexpected(
-                make_error(json_error_code::invalid_syntax, "Expected ',' or ']' in array"));
-        }
-    }
-
-    --depth_;
-    return json_value{make_array_ptr(std::move(array))};
-}
-
-auto parser::parse_object() -> json_result<json_value> {
-    if (!match('{')) {
-        return std::unexpected(make_error(json_error_code::invalid_syntax, "Expected '{'"));
-    }
-
-    ++depth_;
-    json_object object;
-
-    skip_whitespace();
-
-    // Handle empty object
-    if (match('}')) {
-        --depth_;
-        return json_value{make_object_ptr(std::move(object))};
-    }
-
-    // Parse object members
-    while (true) {
-        skip_whitespace();
-
-        // Parse key
-        if (peek() != '"') {
-            --depth_;
-            return std::unexpected(
-                make_error(json_error_code::invalid_syntax, "Expected string key in object"));
-        }
-
-        auto key_result = parse_string();
-        if (!key_result) {
-            --depth_;
-            return std::unexpected(key_result.error());
-        }
-
-        std::string key(key_result->as_string());
-
-        skip_whitespace();
-
-        // Expect colon
-        if (!match(':')) {
-            --depth_;
-            return std::unexpected(
-                make_error(json_error_code::invalid_syntax, "Expected ':' after object key"));
-        }
-
-        // Parse value
-        auto value_result = parse_value();
-        if (!value_result) {
-            --depth_;
-            return std::unexpected(value_result.error());
-        }
-
-        object[std::move(key)] = std::move(*value_result);
-
-        skip_whitespace();
-
-        if (match('}')) {
-            break;
-        } else if (match(',')) {
-            skip_whitespace();
-            continue;
-        } else {
-            --depth_;
-            return std::unexpected(
-                make_error(json_error_code::invalid_syntax, "Expected ',' or '}' in object"));
-        }
-    }
-
-    --depth_;
-    return json_value{make_object_ptr(std::move(object))};
-}
-
 auto parser::skip_whitespace() -> void {
     size_t remaining = end_ - current_;
     const char* new_pos = ::fastjson::skip_whitespace_simd(current_, remaining);
@@ -2430,11 +2584,15 @@ auto parser::parse_string_simd() -> json_result<json_string_data> {
     const char* start = current_;
     const char* string_end = find_string_end_simd(start);
 
-    // Fast path: found closing quote with no escapes — zero-copy string_view
+    // Fast path: found closing quote with no escapes — zero-copy string_view.
+    // The scan steps over escapes, so the backslash check is still required here.
     if (string_end < end_ && *string_end == '"'
         && std::find(start, string_end, '\\') == string_end) {
         json_string_data result(std::string_view(start, string_end - start));
         current_ = string_end + 1;  // Skip the closing quote
+        // No newline can reach here (the scan stops at control characters), so only the
+        // column moves, exactly as advance() would have moved it byte by byte
+        column_ += static_cast<size_t>(string_end - start) + 1;
         return result;
     }
 
@@ -2442,6 +2600,31 @@ auto parser::parse_string_simd() -> json_result<json_string_data> {
     return std::unexpected(json_error{});
 }
 
+// Object keys are stored as std::string, so build the key exactly once from the
+// zero-copy scan instead of wrapping it in a json_value and copying it back out.
+auto parser::parse_key() -> json_result<std::string> {
+    const char* key_start = current_;
+    const size_t key_column = column_;
+    if (!match('"')) {
+        return std::unexpected(
+            make_error(json_error_code::invalid_string, "Expected opening quote"));
+    }
+
+    auto fast = parse_string_simd();
+    if (fast) {
+        return std::string(fast->view());
+    }
+
+    // Escaped key: restore the position of the opening quote and take the full scalar path
+    current_ = key_start;
+    column_ = key_column;
+    auto slow = parse_string();
+    if (!slow) {
+        return std::unexpected(slow.error());
+    }
+    return slow->as_std_string();
+}
+
 // Thread-safe JSON Serializer Implementation
 // ============================================================================
 // TODO: Serializer class definition not implemented yet
@@ -986,7 +986,7 @@ __attribute__((target("sse2"))) static auto skip_whitespace_sse2(std::span<const
     return pos;
 }
 
-__attribute__((target("avx2"))) static auto skip_whitespace_avx2(std::span<const char> data,
+__attribute__((hot, target("avx2"))) static auto skip_whitespace_avx2(std::span<const char> data,
                                                                  size_t start_pos) -> size_t {
     size_t pos = start_pos;
     const size_t size = data.size();
@@ -1116,7 +1116,7 @@ scalar_fallback:
 #if defined(__x86_64__) || defined(_M_X64)
 
 // SIMD string scanning - find end quote or escape
-__attribute__((target("avx2"))) static auto find_string_end_avx2(std::span<const char> data,
+__attribute__((hot, target("avx2"))) static auto find_string_end_avx2(std::span<const char> data,
                                                                  size_t start_pos) -> size_t {
     const __m256i quote = _mm256_set1_epi8('"');
     const __m256i backslash = _mm256_set1_epi8('\\');
@@ -1217,41 +1217,36 @@ static auto find_string_end_neon(std::span<const char> data, size_t start_pos) -
 #if defined(__x86_64__) || defined(_M_X64)
 
 // SIMD number validation - check if all digits/valid number chars
-__attribute__((target("avx2"))) static auto
+// Classifies each byte with two vpshufb nibble lookups instead of one compare per
+// character: 'e'/'E' differ only in bit 5 and share a row, '+', '-' and '.' share
+// the 0x2_ row, digits own the 0x3_ row. A byte is valid iff both lookups agree.
+__attribute__((hot, target("avx2"))) static auto
 validate_number_chars_avx2(std::span<const char> data, size_t start_pos, size_t end_pos) -> bool {
-    const __m256i digit_0 = _mm256_set1_epi8('0' - 1);
-    const __m256i digit_9 = _mm256_set1_epi8('9' + 1);
-    const __m256i minus = _mm256_set1_epi8('-');
-    const __m256i plus = _mm256_set1_epi8('+');
-    const __m256i dot = _mm256_set1_epi8('.');
-    const __m256i e_lower = _mm256_set1_epi8('e');
-    const __m256i e_upper = _mm256_set1_epi8('E');
+    // Class bits: 0x01 = digit, 0x02 = sign/dot, 0x04 = exponent
+    const __m256i lo_table = _mm256_setr_epi8(
+        0x01, 0x01, 0x01, 0x01, 0x01, 0x05, 0x01, 0x01,  // '0'-'9', 'E'/'e' on 5
+        0x01, 0x01, 0x00, 0x02, 0x00, 0x02, 0x02, 0x00,  // '+' on B, '-' on D, '.' on E
+        0x01, 0x01, 0x01, 0x01, 0x01, 0x05, 0x01, 0x01,
+        0x01, 0x01, 0x00, 0x02, 0x00, 0x02, 0x02, 0x00);
+    const __m256i hi_table = _mm256_setr_epi8(
+        0x00, 0x00, 0x02, 0x01, 0x04, 0x00, 0x04, 0x00,  // 0x2_, 0x3_, 0x4_, 0x6_
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00,
+        0x00, 0x00, 0x02, 0x01, 0x04, 0x00, 0x04, 0x00,
+        0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00);
+    const __m256i nibble_mask = _mm256_set1_epi8(0x0F);
+    const __m256i zero = _mm256_setzero_si256();
 
     size_t pos = start_pos;
 
     while (pos + 32 <= end_pos) {
         __m256i chunk = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data.data() + pos));
 
-        // Check if in range '0'-'9'
-        __m256i gt_digit_0 = _mm256_cmpgt_epi8(chunk, digit_0);
-        __m256i lt_digit_9 = _mm256_cmpgt_epi8(digit_9, chunk);
-        __m256i is_digit = _mm256_and_si256(gt_digit_0, lt_digit_9);
-
-        // Check for valid special chars
-        __m256i is_minus = _mm256_cmpeq_epi8(chunk, minus);
-        __m256i is_plus = _mm256_cmpeq_epi8(chunk, plus);
-        __m256i is_dot = _mm256_cmpeq_epi8(chunk, dot);
-        __m256i is_e_lower = _mm256_cmpeq_epi8(chunk, e_lower);
-        __m256i is_e_upper = _mm256_cmpeq_epi8(chunk, e_upper);
-
-        __m256i valid = _mm256_or_si256(
-            is_digit,
-            _mm256_or_si256(_mm256_or_si256(is_minus, is_plus),
-                            _mm256_or_si256(_mm256_or_si256(is_dot, is_e_lower), is_e_upper)));
+        __m256i lo = _mm256_shuffle_epi8(lo_table, _mm256_and_si256(chunk, nibble_mask));
+        __m256i hi = _mm256_shuffle_epi8(
+            hi_table, _mm256_and_si256(_mm256_srli_epi16(chunk, 4), nibble_mask));
+        __m256i invalid = _mm256_cmpeq_epi8(_mm256_and_si256(lo, hi), zero);
 
-        uint32_t mask = _mm256_movemask_epi8(valid);
-
-        if (mask != 0xFFFFFFFF) {
+        if (_mm256_movemask_epi8(invalid) != 0) {
             return false;  // Found invalid character
         }
 
@@ -3125,6 +3120,13 @@ auto json_value::serialize_to_buffer(std::string& buffer, int indent) const -> v
             else if constexpr (std::is_same_v<T, json_boolean>) buffer += v ? "true" : "false";
             else if constexpr (std::is_same_v<T, json_number>) {
                 char tmp[32];
+                // Integral values skip the shortest-round-trip search (-0.0 keeps its sign)
+                if (std::abs(v) < 9.2e18 && v == static_cast<double>(static_cast<int64_t>(v)) &&
+                    !(v == 0.0 && std::signbit(v))) {
+                    auto [ptr, ec] = std::to_chars(tmp, tmp + sizeof(tmp), static_cast<int64_t>(v));
+                    buffer.append(tmp, ptr - tmp);
+                    return;
+                }
                 auto [ptr, ec] = std::to_chars(tmp, tmp + sizeof(tmp), v);
                 if (ec == std::errc{}) buffer.append(tmp, ptr - tmp);
                 else buffer += std::to_string(v);
@@ -8,6 +8,7 @@
 #include <algorithm>
 #include <cstddef>
 #include <cstdint>
+#include <cstring>
 #include <span>
 #include <vector>
 
@@ -42,11 +43,74 @@ struct structural_index {
 };
 
 // ============================================================================
-// SIMD Structural Scanner - AVX2 Version
+// SIMD Structural Scanner - AVX2 + PCLMUL Version
 // ============================================================================
+// Branchless simdjson-style stage 1: each 64-byte block is classified with two
+// vpshufb lookups, escaped quotes are removed with the odd-backslash-run trick,
+// and a carry-less multiply turns the quote mask into an in-string mask. The
+// surviving structural bits are drained with ctz, so no per-byte state machine
+// runs inside strings.
 
 #if defined(__AVX2__)
-__attribute__((target("avx2"))) inline auto
+__attribute__((target("avx2"))) inline auto movemask64(__m256i lo, __m256i hi) -> uint64_t {
+    return static_cast<uint32_t>(_mm256_movemask_epi8(lo)) |
+           (static_cast<uint64_t>(static_cast<uint32_t>(_mm256_movemask_epi8(hi))) << 32);
+}
+
+// Carry state between consecutive 64-byte blocks
+struct stage1_carry {
+    uint64_t prev_escaped = 0;    // next block starts with an escaped byte
+    uint64_t prev_in_string = 0;  // all-ones if the previous block ended inside a string
+};
+
+// Returns the bitmask of structural characters and unescaped quotes in a 64-byte block
+__attribute__((target("avx2,pclmul"))) inline auto
+scan_structural_block_avx2(const char* block, stage1_carry& carry) -> uint64_t {
+    // Low-nibble table for , : [ ] { }. OR-ing 0x20 folds '[' / ']' onto '{' / '}',
+    // so a byte is an operator iff (byte | 0x20) equals its table entry. The fold
+    // also maps control bytes 0x0C / 0x1A onto ',' / ':', so bytes below 0x20 are
+    // masked out explicitly.
+    const __m256i op_table = _mm256_setr_epi8(
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, ':', '{', ',', '}', 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, ':', '{', ',', '}', 0, 0);
+    const __m256i bit5 = _mm256_set1_epi8(0x20);
+    const __m256i below_space = _mm256_set1_epi8(0x1F);
+    const __m256i quote = _mm256_set1_epi8('"');
+    const __m256i backslash = _mm256_set1_epi8('\\');
+
+    __m256i lo = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(block));
+    __m256i hi = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(block + 32));
+
+    uint64_t op = movemask64(
+        _mm256_cmpeq_epi8(_mm256_or_si256(lo, bit5), _mm256_shuffle_epi8(op_table, lo)),
+        _mm256_cmpeq_epi8(_mm256_or_si256(hi, bit5), _mm256_shuffle_epi8(op_table, hi)));
+    op &= movemask64(_mm256_cmpgt_epi8(lo, below_space), _mm256_cmpgt_epi8(hi, below_space));
+    uint64_t quotes = movemask64(_mm256_cmpeq_epi8(lo, quote), _mm256_cmpeq_epi8(hi, quote));
+    uint64_t bs =
+        movemask64(_mm256_cmpeq_epi8(lo, backslash), _mm256_cmpeq_epi8(hi, backslash));
+
+    // Escaped bits: odd positions inside each backslash run
+    constexpr uint64_t even_bits = 0x5555555555555555ULL;
+    bs &= ~carry.prev_escaped;
+    uint64_t follows_escape = (bs << 1) | carry.prev_escaped;
+    uint64_t odd_starts = bs & ~even_bits & ~follows_escape;
+    unsigned long long even_sequences;
+    carry.prev_escaped = __builtin_uaddll_overflow(odd_starts, bs, &even_sequences) ? 1 : 0;
+    uint64_t escaped = (even_bits ^ (even_sequences << 1)) & follows_escape;
+
+    quotes &= ~escaped;
+
+    // Prefix XOR via carry-less multiply by all-ones: bit i = parity of quotes[0..i]
+    uint64_t in_string = static_cast<uint64_t>(_mm_cvtsi128_si64(
+        _mm_clmulepi64_si128(_mm_set_epi64x(0, static_cast<int64_t>(quotes)),
+                             _mm_set1_epi8(static_cast<char>(0xFF)), 0)));
+    in_string ^= carry.prev_in_string;
+    carry.prev_in_string = static_cast<uint64_t>(static_cast<int64_t>(in_string) >> 63);
+
+    return (op & ~in_string) | quotes;
+}
+
+__attribute__((target("avx2,pclmul"))) inline auto
 find_structural_chars_avx2(std::span<const char> input, std::vector<structural_index>& indices)
     -> void {
     const size_t len = input.size();
@@ -55,126 +119,28 @@ find_structural_chars_avx2(std::span<const char> input, std::vector<structural_i
     // Reserve space (heuristic: ~10% of input size for structural chars)
     indices.reserve(len / 10);
 
-    // SIMD constants for structural characters
-    const __m256i left_brace = _mm256_set1_epi8('{');
-    const __m256i right_brace = _mm256_set1_epi8('}');
-    const __m256i left_bracket = _mm256_set1_epi8('[');
-    const __m256i right_bracket = _mm256_set1_epi8(']');
-    const __m256i comma = _mm256_set1_epi8(',');
-    const __m256i colon = _mm256_set1_epi8(':');
-    const __m256i quote = _mm256_set1_epi8('"');
-    const __m256i backslash = _mm256_set1_epi8('\\');
-
-    bool in_string = false;
-    bool prev_escape = false;
+    stage1_carry carry;
 
-    size_t pos = 0;
-
-    // Process 32 bytes at a time with AVX2
-    while (pos + 32 <= len) {
-        __m256i chunk = _mm256_loadu_si256(reinterpret_cast<const __m256i*>(data + pos));
-
-        if (!in_string) {
-            // Find all structural characters
-            __m256i is_left_brace = _mm256_cmpeq_epi8(chunk, left_brace);
-            __m256i is_right_brace = _mm256_cmpeq_epi8(chunk, right_brace);
-            __m256i is_left_bracket = _mm256_cmpeq_epi8(chunk, left_bracket);
-            __m256i is_right_bracket = _mm256_cmpeq_epi8(chunk, right_bracket);
-            __m256i is_comma = _mm256_cmpeq_epi8(chunk, comma);
-            __m256i is_colon = _mm256_cmpeq_epi8(chunk, colon);
-            __m256i is_quote = _mm256_cmpeq_epi8(chunk, quote);
-
-            // Combine all structural characters
-            __m256i structural =
-                _mm256_or_si256(_mm256_or_si256(_mm256_or_si256(is_left_brace, is_right_brace),
-                                                _mm256_or_si256(is_left_bracket, is_right_bracket)),
-                                _mm256_or_si256(_mm256_or_si256(is_comma, is_colon), is_quote));
-
-            uint32_t mask = _mm256_movemask_epi8(structural);
-
-            // Process structural characters left-to-right, tracking string state.
-            // When we encounter a quote, toggle in_string. When inside a string,
-            // skip non-quote structural chars (they're literal characters).
-            while (mask != 0) {
-                int bit_pos = __builtin_ctz(mask);
-                size_t char_pos = pos + bit_pos;
-                char c = data[char_pos];
-
-                if (c == '"') {
-                    in_string = !in_string;
-                    indices.push_back({char_pos, structural_type::quote, {}});
-                } else if (!in_string) {
-                    indices.push_back({char_pos, static_cast<structural_type>(c), {}});
-                }
-
-                mask &= mask - 1;
-            }
-        } else {
-            // In string at chunk start: scalar fallback with proper escape handling.
-            // After finding the closing quote, continue processing the rest of the
-            // chunk for structural characters (don't skip them).
-            for (size_t i = 0; i < 32 && pos + i < len; i++) {
-                char c = data[pos + i];
-
-                if (in_string) {
-                    if (prev_escape) {
-                        prev_escape = false;
-                    } else if (c == '\\') {
-                        prev_escape = true;
-                    } else if (c == '"') {
-                        in_string = false;
-                        indices.push_back({pos + i, structural_type::quote, {}});
-                    }
-                } else {
-                    switch (c) {
-                        case '{': case '}': case '[': case ']': case ',': case ':':
-                            indices.push_back({pos + i, static_cast<structural_type>(c), {}});
-                            break;
-                        case '"':
-                            in_string = true;
-                            indices.push_back({pos + i, structural_type::quote, {}});
-                            break;
-                        default:
-                            break;
-                    }
-                }
-            }
+    auto drain = [&](uint64_t mask, size_t base) {
+        while (mask != 0) {
+            size_t char_pos = base + static_cast<size_t>(__builtin_ctzll(mask));
+            indices.push_back({char_pos, static_cast<structural_type>(data[char_pos]), {}});
+            mask &= mask - 1;
         }
+    };
 
-        pos += 32;
+    size_t pos = 0;
+    while (pos + 64 <= len) {
+        drain(scan_structural_block_avx2(data + pos, carry), pos);
+        pos += 64;
     }
 
-    // Handle remaining bytes sequentially
-    while (pos < len) {
-        char c = data[pos];
-
-        if (in_string) {
-            if (prev_escape) {
-                prev_escape = false;
-            } else if (c == '\\') {
-                prev_escape = true;
-            } else if (c == '"') {
-                in_string = false;
-                indices.push_back({pos, structural_type::quote, {}});
-            }
-        } else {
-            switch (c) {
-                case '{':
-                case '}':
-                case '[':
-                case ']':
-                case ',':
-                case ':':
-                    indices.push_back({pos, static_cast<structural_type>(c), {}});
-                    break;
-                case '"':
-                    in_string = true;
-                    indices.push_back({pos, structural_type::quote, {}});
-                    break;
-            }
-        }
-
-        pos++;
+    // Tail: pad with spaces, which are never structural
+    if (pos < len) {
+        alignas(32) char tail[64];
+        std::memset(tail, ' ', sizeof(tail));
+        std::memcpy(tail, data + pos, len - pos);
+        drain(scan_structural_block_avx2(tail, carry), pos);
     }
 }
 #endif  // __AVX2__
@@ -106,7 +106,7 @@ fi
 # Optional: Run tests
 if command -v pytest &> /dev/null; then
     print_info "Running test suite..."
-    PYTHONPATH="${BUILD_DIR}/lib" pytest tests/ -v --tb=short -x || print_error "Tests failed"
+    PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 PYTHONPATH="${BUILD_DIR}/lib" pytest tests/ -v --tb=short -x || print_error "Tests failed"
     print_status "All tests passed"
 else
     print_info "pytest not found (optional). Skipping tests."
@@ -61,7 +61,7 @@ echo ""
 
 # Check if binding works (will skip if not compiled properly)
 echo "Running pytest..."
-uv run pytest tests/ -v --tb=short 2>&1 | head -50
+PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 uv run pytest tests/ -v --tb=short 2>&1 | head -50
 
 echo ""
 echo "=========================================="
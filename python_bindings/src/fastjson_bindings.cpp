@@ -308,6 +308,60 @@ nb::object to_python_parallel(const json_value& v, int threads, SIMDLevel simd_l
     }
 }
 
+// True if `slot` is a container of the same shape that to_python_into can refill
+inline bool can_refill(const json_value& v, nb::handle slot) {
+    if (v.is_array()) {
+        return PyList_Check(slot.ptr()) &&
+               static_cast<size_t>(PyList_GET_SIZE(slot.ptr())) == v.size();
+    }
+    return v.is_object() && PyDict_Check(slot.ptr());
+}
+
+// Refill a list/dict produced by an earlier to_python() call in place.
+// Shape-matched nested containers are reused; every other slot gets a fresh object.
+inline void to_python_into(const json_value& v, nb::handle out, const ConversionConfig& config) {
+    if (v.is_array()) {
+        if (!PyList_Check(out.ptr())) throw nb::type_error("Expected a list for a JSON array");
+        const auto& arr = v.as_array();
+        if (static_cast<size_t>(PyList_GET_SIZE(out.ptr())) != arr.size())
+            throw nb::value_error("List length does not match the JSON array");
+        for (size_t i = 0; i < arr.size(); ++i) {
+            nb::handle slot = PyList_GET_ITEM(out.ptr(), i);
+            if (can_refill(arr[i], slot)) {
+                to_python_into(arr[i], slot, config);
+            } else {
+                nb::object item = to_python_optimized<false>(arr[i], config);
+                PyList_SetItem(out.ptr(), i, item.release().ptr());
+            }
+        }
+        return;
+    }
+
+    if (v.is_object()) {
+        if (!PyDict_Check(out.ptr())) throw nb::type_error("Expected a dict for a JSON object");
+        const auto& obj = v.as_object();
+        if (static_cast<size_t>(PyDict_Size(out.ptr())) != obj.size()) PyDict_Clear(out.ptr());
+        for (const auto& [key, val] : obj) {
+            nb::object py_key = nb::cast(key);
+            PyObject* slot = PyDict_GetItem(out.ptr(), py_key.ptr());  // borrowed
+            if (slot && can_refill(val, slot)) {
+                to_python_into(val, slot, config);
+            } else {
+                nb::object item = to_python_optimized<false>(val, config);
+                PyDict_SetItem(out.ptr(), py_key.ptr(), item.ptr());
+            }
+        }
+        // Same size but different keys: stale entries remain, so rebuild from scratch
+        if (static_cast<size_t>(PyDict_Size(out.ptr())) != obj.size()) {
+            PyDict_Clear(out.ptr());
+            to_python_into(v, out, config);
+        }
+        return;
+    }
+
+    throw nb::type_error("to_python_into requires an array or object");
+}
+
 NB_MODULE(fastjson, m) {
     m.doc() = "FastestJSONInTheWest Python Bindings (SIMD, COW, Parallel)";
 
@@ -416,7 +470,13 @@ NB_MODULE(fastjson, m) {
             SIMDLevel level = static_cast<SIMDLevel>(simd_level);
             return to_python_parallel(v, threads, level);
         }, "threads"_a = 0, "simd_level"_a = 0,
-           "Convert to native Python objects (parallel) with SIMD level selection");
+           "Convert to native Python objects (parallel) with SIMD level selection")
+        .def("to_python_into", [](const json_value& v, nb::handle out, int simd_level) {
+            ConversionConfig config;
+            config.simd_level = get_effective_simd_level(static_cast<SIMDLevel>(simd_level));
+            to_python_into(v, out, config);
+        }, "out"_a, "simd_level"_a = 0,
+           "Refill a list/dict returned by an earlier to_python() in place, reusing nested containers");
 
     m.def("set_num_threads", [](int threads) {
         fastjson_parallel::set_num_threads(threads);
@@ -444,19 +504,66 @@ NB_MODULE(fastjson, m) {
 
     // LINQ Bindings
     using Query = fastjson::linq::query_result<json_value>;
+    // Python callbacks receive one reusable JSONValue per stage: each element is assigned
+    // into it before the call, so no wrapper object is allocated per element. If the callback
+    // kept a reference to its argument, the wrapper is handed over to Python and a fresh one
+    // takes its place, so retained arguments never change under the caller.
     nb::class_<Query>(m, "JSONQuery")
         .def("where", [](Query& self, nb::callable predicate) {
-            return self.where([predicate](const json_value& v) {
+            nb::object view = nb::cast(json_value{});
+            json_value* slot = nb::inst_ptr<json_value>(view);
+            return self.where([predicate, view = std::move(view), slot](const json_value& v) mutable {
                 nb::gil_scoped_acquire acquire;
-                return nb::cast<bool>(predicate(v));
+                *slot = v;
+                bool keep = nb::cast<bool>(predicate(view));
+                if (Py_REFCNT(view.ptr()) > 1) {
+                    view = nb::cast(json_value{});
+                    slot = nb::inst_ptr<json_value>(view);
+                }
+                return keep;
             });
         })
         .def("select", [](Query& self, nb::callable transform) {
-            return self.select([transform](const json_value& v) -> json_value {
+            nb::object view = nb::cast(json_value{});
+            json_value* slot = nb::inst_ptr<json_value>(view);
+            return self.select([transform, view = std::move(view), slot](const json_value& v) mutable
+                                   -> json_value {
                 nb::gil_scoped_acquire acquire;
-                return nb::cast<json_value>(transform(v));
+                *slot = v;
+                json_value result = nb::cast<json_value>(transform(view));
+                if (Py_REFCNT(view.ptr()) > 1) {
+                    view = nb::cast(json_value{});
+                    slot = nb::inst_ptr<json_value>(view);
+                }
+                return result;
             });
         })
+        // Native field operators: the whole stage runs in C++ without calling back into Python
+        .def("where_field_gt", [](Query& self, const std::string& key, double threshold) {
+            return self.where([&key, threshold](const json_value& v) {
+                if (!v.is_object()) return false;
+                const auto& obj = v.as_object();
+                auto it = obj.find(key);
+                if (it == obj.end()) return false;
+                const json_value& field = it->second;
+                if (field.is_number()) return field.as_number() > threshold;
+                // 128-bit storage is compared in __float128, which holds every double exactly
+                if (field.is_number_128() || field.is_int_128() || field.is_uint_128()) {
+                    return field.as_float128() > static_cast<__float128>(threshold);
+                }
+                return false;
+            });
+        }, "key"_a, "threshold"_a, nb::call_guard<nb::gil_scoped_release>(),
+           "Keep objects whose numeric field `key` is greater than `threshold`")
+        .def("select_field", [](Query& self, const std::string& key) {
+            return self.select([&key](const json_value& v) -> json_value {
+                if (!v.is_object()) return json_value{};
+                const auto& obj = v.as_object();
+                auto it = obj.find(key);
+                return it == obj.end() ? json_value{} : it->second;
+            });
+        }, "key"_a, nb::call_guard<nb::gil_scoped_release>(),
+           "Project each object onto its field `key` (null when absent)")
         .def("to_list", [](Query& self) {
             nb::list result;
             ConversionConfig config;
@@ -2,6 +2,9 @@
 Pytest configuration and fixtures for FastestJSONInTheWest Python bindings tests.
 """
 
+import functools
+import multiprocessing
+import os
 import pytest
 import sys
 from pathlib import Path
@@ -9,14 +12,23 @@ from pathlib import Path
 # Add source directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Sample payloads are plain strings, so they are built once at import time
+_LARGE_ARRAY_JSON = "[" + ",".join(f'{{"id": {i}, "value": {i*2}}}' for i in range(100)) + "]"
 
-@pytest.fixture
+
+@functools.lru_cache(maxsize=None)
+def _int_array_json(n):
+    """JSON text for [0, 1, ..., n-1]; each size is built once per session."""
+    return "[" + ",".join(map(str, range(n))) + "]"
+
+
+@pytest.fixture(scope="session")
 def sample_json_simple():
     """Fixture providing a simple JSON string."""
     return '{"name": "test", "value": 42}'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_complex():
     """Fixture providing a complex JSON structure."""
     return '''{
@@ -35,13 +47,13 @@ def sample_json_complex():
     }'''
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_array():
     """Fixture providing a JSON array."""
     return '[{"id": 1}, {"id": 2}, {"id": 3}]'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_unicode():
     """Fixture providing JSON with Unicode characters."""
     return '''{
@@ -55,7 +67,7 @@ def sample_json_unicode():
     }'''
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_edge_cases():
     """Fixture providing JSON with edge cases."""
     return '''{
@@ -72,17 +84,72 @@ def sample_json_edge_cases():
     }'''
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_deeply_nested():
     """Fixture providing deeply nested JSON."""
     return '{"a":{"b":{"c":{"d":{"e":{"f":{"g":{"h":{"i":{"j":42}}}}}}}}}}'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_json_large_array():
     """Fixture providing a large JSON array."""
-    items = [f'{{"id": {i}, "value": {i*2}}}' for i in range(100)]
-    return '[' + ','.join(items) + ']'
+    return _LARGE_ARRAY_JSON
+
+
+@pytest.fixture(scope="session")
+def int_array_json():
+    """Fixture providing a cached builder: int_array_json(n) -> "[0,1,...,n-1]"."""
+    return _int_array_json
+
+
+@pytest.fixture(scope="session")
+def large_int_array_json():
+    """Fixture providing a 100k-element integer JSON array, built once per session."""
+    return _int_array_json(100_000)
+
+
+@pytest.fixture(scope="session")
+def keyed_int_object_json():
+    """Fixture providing a 10k-member {"key_i": i} JSON object, built once per session."""
+    return "{" + ",".join(f'"key_{i}":{i}' for i in range(10_000)) + "}"
+
+
+@pytest.fixture(scope="session")
+def deep_nested_payload():
+    """Fixture providing (depth, JSON) for a 100-level nested array around 42."""
+    depth = 100
+    return depth, f"{'[' * depth}42{']' * depth}"
+
+
+@pytest.fixture(scope="session")
+def val_objects_json():
+    """Fixture providing a 5000-element [{"val": i}, ...] JSON array, built once per session."""
+    return "[" + ",".join(f'{{"val": {i}}}' for i in range(5000)) + "]"
+
+
+@pytest.fixture(scope="session")
+def cpu_count():
+    """Cores this process may run on; OpenMP sizes its pool from the affinity mask, not the host."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return multiprocessing.cpu_count()
+
+
+@pytest.fixture(scope="session")
+def num_threads():
+    """fastjson's default thread count, read once per session."""
+    import fastjson
+    return fastjson.get_num_threads()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fastjson_warmup():
+    """Load the extension and start its thread pool before the first timed test."""
+    try:
+        import fastjson
+    except ImportError:
+        return  # test modules report the missing extension themselves
+    fastjson.parse("[0, 1]").to_python(threads=2)
 
 
 class JsonValidator:
@@ -119,10 +186,14 @@ class JsonValidator:
         return isinstance(value, dict)
 
 
-@pytest.fixture
+# Stateless, so one shared instance serves every test
+_VALIDATOR = JsonValidator()
+
+
+@pytest.fixture(scope="session")
 def json_validator():
     """Fixture providing JSON validator."""
-    return JsonValidator()
+    return _VALIDATOR
 
 
 # Custom markers
@@ -142,17 +213,24 @@ def pytest_configure(config):
     )
 
 
+# Node-id substrings that auto-apply a marker (several substrings may share one)
+_MARKER_TABLE = (
+    (("unicode",), "unicode"),
+    (("performance", "benchmark"), "benchmark"),
+    (("slow",), "slow"),
+)
+
+
 # Pytest hooks for test reporting
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test names."""
+    markers = [(substrings, getattr(pytest.mark, name)) for substrings, name in _MARKER_TABLE]
     for item in items:
         # Auto-add markers based on test function names
-        if "unicode" in item.nodeid.lower():
-            item.add_marker(pytest.mark.unicode)
-        if "performance" in item.nodeid.lower() or "benchmark" in item.nodeid.lower():
-            item.add_marker(pytest.mark.benchmark)
-        if "slow" in item.nodeid.lower():
-            item.add_marker(pytest.mark.slow)
+        nodeid = item.nodeid.lower()
+        for substrings, marker in markers:
+            if any(sub in nodeid for sub in substrings):
+                item.add_marker(marker)
 
 
 # Optional: pytest-cov configuration via hook
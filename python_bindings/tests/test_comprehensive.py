@@ -32,10 +32,9 @@ def test_empty_containers():
     py_obj = val.to_python()
     assert py_obj == {"arr": [], "obj": {}}
 
-def test_deep_nesting():
+def test_deep_nesting(deep_nested_payload):
     """Test deeply nested structures."""
-    nest_count = 100
-    json_str = "[" * nest_count + "42" + "]" * nest_count
+    nest_count, json_str = deep_nested_payload
     val = fastjson.parse(json_str)
     
     curr = val
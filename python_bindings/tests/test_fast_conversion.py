@@ -2,12 +2,14 @@ import fastjson
 import pytest
 import time
 
-def test_cow_behavior():
+# JSON escapes for the characters used in test_simd_string_escaping (one pass via str.translate)
+_JSON_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n'})
+
+def test_cow_behavior(large_int_array_json):
     """Verify that JSONValue uses Copy-On-Write for efficiency."""
     print("\nTesting COW behavior...")
-    # Create a reasonably large array (100k instead of 1M for faster test)
-    large_list = [i for i in range(100000)]
-    val = fastjson.parse(str(large_list))
+    # Reasonably large array (100k instead of 1M for faster test)
+    val = fastjson.parse(large_int_array_json)
     
     # Copying is O(1)
     start = time.perf_counter()
@@ -29,15 +31,11 @@ def test_cow_behavior():
     assert val[0].as_int() == 0
     assert val_copy[0].as_int() == 999999
 
-def test_parallel_conversion():
+def test_parallel_conversion(keyed_int_object_json):
     """Test parallel conversion from JSONValue to native Python objects."""
     print("\nTesting parallel conversion...")
-    size = 10000  # Reduced for faster test
-    data = {"key_" + str(i): i for i in range(size)}
-    import json
-    json_str = json.dumps(data)
-    
-    val = fastjson.parse(json_str)
+    # 10k members, reduced for faster test
+    val = fastjson.parse(keyed_int_object_json)
     
     # Test serial conversion
     start_serial = time.perf_counter()
@@ -65,7 +63,7 @@ def test_simd_string_escaping():
     s = "Text with \"quotes\" and \\backslashes\\ and \n newlines." * 1000
     val = fastjson.JSONValue()
     # Manual construction might be slow but we can test __str__
-    v = fastjson.parse('"' + s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"')
+    v = fastjson.parse('"' + s.translate(_JSON_ESCAPE_TABLE) + '"')
     
     start = time.perf_counter()
     out = str(v)
@@ -97,7 +95,6 @@ def test_128bit_conversion():
     assert py_val == neg_int, f"Failed for negative: got {py_val}"
 
 if __name__ == "__main__":
-    test_parallel_conversion()
-    test_128bit_conversion()
-    print("All tests passed!")
+    # Fixtures come from conftest.py, so run through pytest
+    pytest.main([__file__, "-s"])
 
@@ -31,6 +31,19 @@ def test_parse_array():
     # Note: JSON numbers are floats
     assert py_list == [1.0, 2.0, 3.0]
 
+def test_to_python_into():
+    """Refilling an earlier to_python() result reuses its containers."""
+    val = fastjson.parse('{"items": [1, 2], "meta": {"ok": true}}')
+    out = {"items": [0, 0], "meta": {"stale": 1}}
+    items = out["items"]
+
+    val.to_python_into(out)
+    assert out == val.to_python()
+    assert out["items"] is items  # same-length list is refilled in place
+
+    with pytest.raises(ValueError):
+        fastjson.parse('[1, 2, 3]').to_python_into([0])
+
 def test_linq_query():
     """Test LINQ-style query."""
     json_str = '[{"val": 10}, {"val": 20}, {"val": 30}]'
@@ -45,6 +58,42 @@ def test_linq_query():
     # to_list() returns Python floats directly
     assert result == [20.0, 30.0]
 
+def test_linq_query_retained_arguments():
+    """Arguments a callback keeps must not be overwritten by later elements."""
+    data = fastjson.parse('[{"val": 10}, {"val": 20}, {"val": 30}]')
+
+    seen = []
+    fastjson.query(data).where(lambda x: seen.append(x) or True).to_list()
+    assert [x["val"].as_int() for x in seen] == [10, 20, 30]
+
+    # Returning the argument itself from select must not alias it either
+    kept = []
+    result = fastjson.query(data).select(lambda x: kept.append(x) or x).to_list()
+    assert [x["val"].as_int() for x in kept] == [10, 20, 30]
+    assert result == [{"val": 10.0}, {"val": 20.0}, {"val": 30.0}]
+
+def test_linq_query_native():
+    """Test LINQ query with native field operators (no Python callbacks per element)."""
+    json_str = '[{"val": 10}, {"val": 20}, {"val": 30}, {"other": 40}]'
+    data = fastjson.query(fastjson.parse(json_str))
+
+    result = data.where_field_gt("val", 15).select_field("val").to_list()
+    assert result == [20.0, 30.0]
+
+    # Missing fields project to null
+    assert data.select_field("other").to_list() == [None, None, None, 40.0]
+
+def test_linq_query_native_128bit():
+    """where_field_gt compares fields stored as 128-bit numbers too."""
+    big = 2 ** 100
+    huge = 2 ** 128 - 1  # only fits unsigned 128-bit storage
+    json_str = f'[{{"v": {big}}}, {{"v": -{big}}}, {{"v": {huge}}}, {{"v": 5}}]'
+    data = fastjson.query(fastjson.parse(json_str))
+
+    result = data.where_field_gt("v", 0).select_field("v").to_list()
+    assert result == [big, huge, 5]
+    assert data.where_field_gt("v", 1e35).select_field("v").to_list() == [huge]
+
 def test_vectors():
     """Test numeric vector binding - SKIPPED: Int64Vector not in current API."""
     pytest.skip("Int64Vector not exposed in current Python bindings")
@@ -1,17 +1,16 @@
 import fastjson
-import multiprocessing
+import pytest
 
-def test_parallelism_limit():
-    max_threads = multiprocessing.cpu_count()
-    current_threads = fastjson.get_num_threads()
+def test_parallelism_limit(cpu_count, num_threads):
+    expected_limit = max(1, int(cpu_count * 0.3))
     
-    expected_limit = max(1, int(max_threads * 0.3))
-    
-    print(f"Max CPU cores: {max_threads}")
-    print(f"FastJSON current threads: {current_threads}")
+    print(f"Max CPU cores: {cpu_count}")
+    print(f"FastJSON current threads: {num_threads}")
     print(f"Expected limit (30%): {expected_limit}")
     
-    assert current_threads == expected_limit
+    assert num_threads == expected_limit
+    # Asking again must not re-initialise the pool to a different size
+    assert fastjson.get_num_threads() == num_threads
 
 if __name__ == "__main__":
-    test_parallelism_limit()
+    pytest.main([__file__, "-s"])
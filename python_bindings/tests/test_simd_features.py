@@ -12,11 +12,34 @@ Tests the new Python API:
 """
 
 import fastjson
+import numpy as np
 import pytest
 import time
 import concurrent.futures
 
 
+def _level_param(level):
+    """A parametrize case for `level`, skipped (not waterfalled) when the CPU lacks it."""
+    return pytest.param(
+        level,
+        id=level.name,
+        marks=pytest.mark.skipif(
+            not fastjson.is_simd_level_available(level.value),
+            reason=f"{level.name} not available on this CPU",
+        ),
+    )
+
+
+# One conversion case per SIMD level
+SIMD_LEVEL_PARAMS = [_level_param(level) for level in fastjson.SIMDLevel]
+
+
+@pytest.fixture(scope="module")
+def caps():
+    """SIMD capabilities are fixed for the process, so detect them once."""
+    return fastjson.get_simd_capabilities()
+
+
 class TestSIMDCapabilities:
     """Test SIMD capability detection."""
     
@@ -37,10 +60,8 @@ class TestSIMDCapabilities:
         assert isinstance(caps.amx, bool)
         assert isinstance(caps.neon, bool)
         
-    def test_capability_hierarchy(self):
+    def test_capability_hierarchy(self, caps):
         """Test that SIMD capabilities follow expected hierarchy."""
-        caps = fastjson.get_simd_capabilities()
-        
         # If AVX2 is available, SSE2 should also be available
         if caps.avx2:
             assert caps.sse2
@@ -50,25 +71,21 @@ class TestSIMDCapabilities:
         if caps.avx512f:
             assert caps.avx2
             
-    def test_optimal_path_not_empty(self):
+    def test_optimal_path_not_empty(self, caps):
         """Test that optimal_path is always set."""
-        caps = fastjson.get_simd_capabilities()
         assert caps.optimal_path is not None
         assert len(caps.optimal_path) > 0
         
-    def test_bytes_per_iteration_positive(self):
+    def test_bytes_per_iteration_positive(self, caps):
         """Test that bytes_per_iteration is positive."""
-        caps = fastjson.get_simd_capabilities()
         assert caps.bytes_per_iteration > 0
         
-    def test_register_count_positive(self):
+    def test_register_count_positive(self, caps):
         """Test that register_count is positive."""
-        caps = fastjson.get_simd_capabilities()
         assert caps.register_count >= 1
         
-    def test_repr(self):
+    def test_repr(self, caps):
         """Test that capabilities have a string representation."""
-        caps = fastjson.get_simd_capabilities()
         repr_str = repr(caps)
         assert "SIMDCapabilities" in repr_str
         assert "bytes/iter" in repr_str
@@ -112,9 +129,8 @@ class TestSIMDLevelEnum:
 class TestWaterfallLogic:
     """Test SIMD waterfall fallback logic."""
     
-    def test_auto_selects_best(self):
+    def test_auto_selects_best(self, caps):
         """Test that AUTO selects the best available level."""
-        caps = fastjson.get_simd_capabilities()
         effective = fastjson.get_effective_simd_level(fastjson.SIMDLevel.AUTO.value)
         
         # Effective level should match best_level
@@ -127,10 +143,8 @@ class TestWaterfallLogic:
         effective = fastjson.get_effective_simd_level(fastjson.SIMDLevel.SCALAR.value)
         assert effective == fastjson.SIMDLevel.SCALAR
         
-    def test_waterfall_fallback(self):
+    def test_waterfall_fallback(self, caps):
         """Test that unavailable levels fall through to lower levels."""
-        caps = fastjson.get_simd_capabilities()
-        
         # If AVX-512 is not available, requesting it should waterfall down
         if not caps.avx512f:
             effective = fastjson.get_effective_simd_level(fastjson.SIMDLevel.AVX512.value)
@@ -139,22 +153,23 @@ class TestWaterfallLogic:
             # But shouldn't be higher than requested
             assert effective.value >= fastjson.SIMDLevel.AVX512.value
             
-    def test_available_levels_effective(self):
-        """Test that available levels are effective unchanged."""
-        for level in [fastjson.SIMDLevel.AVX512, fastjson.SIMDLevel.AVX2, 
-                      fastjson.SIMDLevel.SSE4, fastjson.SIMDLevel.SSE2,
-                      fastjson.SIMDLevel.SCALAR]:
-            if fastjson.is_simd_level_available(level.value):
-                effective = fastjson.get_effective_simd_level(level.value)
-                assert effective == level
+    @pytest.mark.parametrize("level", [
+        _level_param(level) for level in (
+            fastjson.SIMDLevel.AVX512, fastjson.SIMDLevel.AVX2,
+            fastjson.SIMDLevel.SSE4, fastjson.SIMDLevel.SSE2,
+            fastjson.SIMDLevel.SCALAR)
+    ])
+    def test_available_level_effective(self, level):
+        """Test that an available level is effective unchanged."""
+        assert fastjson.get_effective_simd_level(level.value) == level
 
 
 class TestConversionWithSIMDLevel:
     """Test to_python conversion with SIMD level selection."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def test_data(self):
-        """Create test JSON data."""
+        """Create test JSON data (parsed once; the tests only read it)."""
         return fastjson.parse('''
         {
             "users": [
@@ -173,15 +188,13 @@ class TestConversionWithSIMDLevel:
         assert len(result["users"]) == 3
         assert result["users"][0]["emoji"] == "🚀"
         
-    def test_explicit_avx2_conversion(self, test_data):
-        """Test conversion with explicit AVX2 SIMD level."""
-        result = test_data.to_python(simd_level=fastjson.SIMDLevel.AVX2.value)
-        assert "users" in result
+    @pytest.mark.parametrize("simd_level", SIMD_LEVEL_PARAMS)
+    def test_conversion(self, test_data, simd_level):
+        """Test conversion at each available SIMD level against the shared parsed tree."""
+        result = test_data.to_python(simd_level=simd_level.value)
+        assert len(result["users"]) == 3
+        assert result["users"][0]["emoji"] == "🚀"
         assert result["users"][2]["greeting"] == "こんにちは"
-        
-    def test_scalar_conversion(self, test_data):
-        """Test conversion with SCALAR fallback."""
-        result = test_data.to_python(simd_level=fastjson.SIMDLevel.SCALAR.value)
         assert result["metadata"]["math"] == "∑∫∂"
         
     def test_parallel_conversion(self, test_data):
@@ -205,14 +218,15 @@ class TestParallelismControl:
         result = data.to_python(threads=1)
         assert result == [1.0, 2.0, 3.0, 4.0, 5.0]
         
-    def test_multi_thread(self):
+    def test_multi_thread(self, int_array_json):
         """Test multi-threaded conversion."""
-        # Create large array for parallel processing
-        large_json = '[' + ','.join(str(i) for i in range(10000)) + ']'
-        data = fastjson.parse(large_json)
+        # Large array for parallel processing
+        data = fastjson.parse(int_array_json(10000))
         
         result = data.to_python(threads=4)
-        assert len(result) == 10000
+        # Full-value compare catches off-by-one errors at thread chunk boundaries
+        assert np.array_equal(np.asarray(result, dtype=np.float64),
+                              np.arange(10000, dtype=np.float64))
         
     def test_thread_safety_concurrent(self):
         """Test thread safety with concurrent parsing and conversion."""
@@ -222,12 +236,24 @@ class TestParallelismControl:
             data = fastjson.parse(test_json)
             return data.to_python(threads=2)
         
+        # Correctness only: Python threads contend on the GIL, so keep this short
         with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            results = list(executor.map(parse_and_convert, range(100)))
+            results = list(executor.map(parse_and_convert, range(10)))
             
-        assert len(results) == 100
+        assert len(results) == 10
         assert all(r["value"] == 42.0 for r in results)
 
+    def test_native_parallel_conversion(self, large_int_array_json, cpu_count):
+        """The native parallel conversion path should match the serial one."""
+        data = fastjson.parse(large_int_array_json)
+        threads = max(2, min(8, cpu_count))
+
+        serial = data.to_python(threads=1)
+        parallel = data.to_python(threads=threads)
+
+        assert len(serial) == 100_000
+        assert parallel == serial
+
 
 class TestWaterfallOrderDocumentation:
     """Test that waterfall order is documented."""
@@ -250,26 +276,33 @@ class TestWaterfallOrderDocumentation:
 class TestPerformanceWithSIMDLevels:
     """Test performance differences between SIMD levels."""
     
-    def test_simd_vs_scalar_performance(self):
+    @pytest.fixture(scope="class")
+    def data(self, val_objects_json):
+        """Parsed 5000-object tree shared by the timing loops."""
+        return fastjson.parse(val_objects_json)
+
+    def test_simd_vs_scalar_performance(self, data):
         """Test that SIMD conversion is not slower than scalar."""
-        large_json = '[' + ','.join(f'{{"val": {i}}}' for i in range(5000)) + ']'
-        data = fastjson.parse(large_json)
+        if fastjson.get_effective_simd_level(fastjson.SIMDLevel.AUTO.value) == fastjson.SIMDLevel.SCALAR:
+            pytest.skip("no SIMD available; AUTO and SCALAR run the same kernel")
         
-        # Warm up
-        data.to_python()
+        # Warm up; the result doubles as the container refilled by each timed pass
+        template = data.to_python()
         
         # Time AUTO (best available)
         start = time.perf_counter()
-        for _ in range(10):
-            data.to_python(simd_level=fastjson.SIMDLevel.AUTO.value)
+        for _ in range(3):
+            data.to_python_into(template, simd_level=fastjson.SIMDLevel.AUTO.value)
         auto_time = time.perf_counter() - start
         
         # Time SCALAR
         start = time.perf_counter()
-        for _ in range(10):
-            data.to_python(simd_level=fastjson.SIMDLevel.SCALAR.value)
+        for _ in range(3):
+            data.to_python_into(template, simd_level=fastjson.SIMDLevel.SCALAR.value)
         scalar_time = time.perf_counter() - start
         
+        assert template == data.to_python()
+        
         # AUTO should not be significantly slower than SCALAR
         # (it's actually expected to be faster, but we're just checking correctness)
         print(f"\nAUTO: {auto_time*1000:.2f}ms, SCALAR: {scalar_time*1000:.2f}ms")
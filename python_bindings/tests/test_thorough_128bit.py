@@ -4,16 +4,18 @@ import numpy as np
 import json
 import time
 
+def _parse_batch(cases):
+    """Parse all cases as one JSON array so the parser is set up once."""
+    return fastjson.parse("[" + ",".join(map(str, cases)) + "]").to_python()
+
 def test_basic_integers():
     """Test zero, 1, -1 and small integers.
     
     NOTE: JSON numbers without decimals are stored as double internally.
     Only 128-bit integers (exceeding 64-bit range) are converted to Python int.
     """
-    for i in [0, 1, -1, 42, -42, 1000, -1000]:
-        json_str = str(i)
-        val = fastjson.parse(json_str)
-        py_val = val.to_python()
+    cases = [0, 1, -1, 42, -42, 1000, -1000]
+    for i, py_val in zip(cases, _parse_batch(cases), strict=True):
         assert py_val == i, f"Failed for {i}"
         # JSON numbers are stored as float, but value equality still works
         assert isinstance(py_val, (int, float)), f"Expected int or float for {i}, got {type(py_val)}"
@@ -28,10 +30,8 @@ def test_int64_boundaries():
     int64_min = -9223372036854775808
     
     # Numbers just outside 64-bit range get promoted to 128-bit int
-    for i in [int64_max + 1, int64_min - 1]:
-        json_str = str(i)
-        val = fastjson.parse(json_str)
-        py_val = val.to_python()
+    cases = [int64_max + 1, int64_min - 1]
+    for i, py_val in zip(cases, _parse_batch(cases), strict=True):
         assert py_val == i, f"Failed for {i}"
         assert isinstance(py_val, int), f"Expected int for {i}, got {type(py_val)}"
 
@@ -50,10 +50,7 @@ def test_int128_boundaries():
         uint128_max - 1
     ]
     
-    for i in test_cases:
-        json_str = str(i)
-        val = fastjson.parse(json_str)
-        py_val = val.to_python()
+    for i, py_val in zip(test_cases, _parse_batch(test_cases), strict=True):
         assert py_val == i, f"Failed for {i}"
         assert isinstance(py_val, int), f"Expected int for {i}, got {type(py_val)}"
 
@@ -111,7 +108,8 @@ def test_parallel_mixed_parsing():
         else:
             large_array.append(1 << (64 + (i % 60)))
             
-    json_str = json.dumps(large_array)
+    # str() of ints and finite floats is already valid JSON, so skip json.dumps
+    json_str = "[" + ",".join(map(str, large_array)) + "]"
     
     # Parse and convert in parallel
     start = time.perf_counter()
@@ -122,15 +120,16 @@ def test_parallel_mixed_parsing():
     print(f"\nParallel parse/convert of {size} items: {end - start:.4f}s")
     
     assert len(py_obj) == size
-    for i in range(size):
-        assert py_obj[i] == large_array[i]
-        # 128-bit ints (i % 3 == 2) are proper Python ints
-        # Small ints (i % 3 == 0) may be floats
-        # Floats (i % 3 == 1) are floats
-        if i % 3 == 2:
-            assert isinstance(py_obj[i], int), f"128-bit int at {i} should be int, got {type(py_obj[i])}"
-        elif i % 3 == 1:
-            assert isinstance(py_obj[i], float)
+    # Small ints (i % 3 == 0) may be floats; compare the slice as float64
+    assert np.array_equal(np.array(py_obj[0::3], dtype=np.float64),
+                          np.array(large_array[0::3], dtype=np.float64))
+    # Floats (i % 3 == 1) are floats
+    assert np.array_equal(np.array(py_obj[1::3], dtype=np.float64),
+                          np.array(large_array[1::3], dtype=np.float64))
+    assert set(map(type, py_obj[1::3])) == {float}
+    # 128-bit ints (i % 3 == 2) don't fit NumPy dtypes; they must be proper Python ints
+    assert py_obj[2::3] == large_array[2::3]
+    assert set(map(type, py_obj[2::3])) == {int}
 
 if __name__ == "__main__":
     pytest.main([__file__])
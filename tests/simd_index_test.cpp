@@ -0,0 +1,88 @@
+/**
+ * STRUCTURAL INDEX TEST
+ * Checks the AVX2 stage-1 scanner against the scalar reference scanner
+ */
+
+#include <iostream>
+#include <string>
+#include <vector>
+
+#include "../modules/fastjson_simd_index.h"
+
+using namespace fastjson;
+
+#if defined(__AVX2__)
+// Counted rather than assert()ed: the CMake Release build defines NDEBUG
+static int failures = 0;
+
+static void check(bool ok, const char* what) {
+    if (!ok) {
+        std::cout << "✗ " << what << std::endl;
+        ++failures;
+    }
+}
+
+static auto scan_both(const std::string& json) -> bool {
+    std::vector<structural_index> simd;
+    std::vector<structural_index> scalar;
+    find_structural_chars_avx2(json, simd);
+    find_structural_chars_scalar(json, scalar);
+
+    if (simd.size() != scalar.size()) return false;
+    for (size_t i = 0; i < simd.size(); ++i) {
+        if (simd[i].position != scalar[i].position || simd[i].type != scalar[i].type) {
+            return false;
+        }
+    }
+    return true;
+}
+
+void test_plain_documents() {
+    std::cout << "\n=== Test: Plain Documents ===" << std::endl;
+
+    check(scan_both(R"({"a": [1, 2, {"b": null}], "c": "x,y:z"})"), "nested document");
+    check(scan_both(R"(["esc \" quote", "back\\\\", {"k": [true, false]}])"), "escaped strings");
+
+    std::cout << "✓ AVX2 and scalar indices compared" << std::endl;
+}
+
+void test_control_bytes() {
+    std::cout << "\n=== Test: Control Bytes ===" << std::endl;
+
+    // 0x0C and 0x1A share a low nibble with ',' and ':' and must not be indexed
+    check(scan_both(std::string("[1,\x0c 2]")), "form feed after comma");
+    check(scan_both(std::string("{\"a\"\x1a 1}")), "0x1A after key");
+
+    // Every byte below 0x20, both inside and across a 64-byte block boundary
+    std::string all_controls;
+    for (int c = 0; c < 0x20; ++c) {
+        all_controls += '[';
+        all_controls += static_cast<char>(c);
+        all_controls += ']';
+    }
+    check(scan_both(all_controls), "every control byte");
+    check(scan_both(all_controls + all_controls + all_controls), "control bytes across blocks");
+
+    std::cout << "✓ Control bytes compared" << std::endl;
+}
+#endif
+
+int main() {
+#if defined(__AVX2__)
+    // Built with -mavx2 -mpclmul; 77 tells ctest the host cannot run it
+    if (!__builtin_cpu_supports("avx2") || !__builtin_cpu_supports("pclmul")) {
+        std::cout << "AVX2/PCLMUL not supported on this CPU; skipping" << std::endl;
+        return 77;
+    }
+    test_plain_documents();
+    test_control_bytes();
+    if (failures != 0) {
+        std::cout << "\n" << failures << " structural index checks failed" << std::endl;
+        return 1;
+    }
+    std::cout << "\nAll structural index tests passed" << std::endl;
+#else
+    std::cout << "AVX2 not enabled; nothing to compare" << std::endl;
+#endif
+    return 0;
+}
@@ -251,6 +251,30 @@ int main() {
     auto err5 = fastjson::parse("undefined");
     TEST("Invalid literal fails", !err5.has_value());
 
+    // ========== Serialization (3 tests) ==========
+    std::cout << "\n--- Serialization ---\n";
+
+    auto sz1 = fastjson::parse(R"({"list": [1, "two", [3, {"four": null}]], "flag": true})");
+    std::string streamed;
+    sz1->write_to([&](std::string_view chunk) { streamed += chunk; });
+    TEST("Streamed output matches to_string", streamed == sz1->to_string());
+
+    size_t chunks = 0;
+    streamed.clear();
+    sz1->write_to(
+        [&](std::string_view chunk) {
+            streamed += chunk;
+            ++chunks;
+        },
+        4);
+    TEST("Small chunk size flushes several chunks",
+         chunks > 1 && streamed == sz1->to_string());
+
+    auto sz2 = fastjson::parse("42");
+    std::string scalar_out;
+    sz2->write_to([&](std::string_view chunk) { scalar_out += chunk; });
+    TEST("Streamed scalar", scalar_out == "42");
+
     // ========== Summary ==========
     std::cout << "\n=== Test Summary ===\n";
     std::cout << "Total tests: " << (tests_passed + tests_failed) << "\n";
@@ -0,0 +1,41 @@
+#include <iostream>
+#include <string>
+import fastjson;
+
+// Parses `json`, which must fail at the first 'x', and checks the reported column
+static bool error_at_x(const std::string& json) {
+    auto result = fastjson::parse(json);
+    if (result.has_value()) return false;
+    size_t expected_column = json.find('x') + 1;
+    return result.error().line == 1 && result.error().column == expected_column;
+}
+
+int main() {
+    std::cout << "Testing error line/column after string literals..." << std::endl;
+
+    int pass = 0, fail = 0;
+    auto check = [&](const char* name, bool ok) {
+        if (ok) {
+            std::cout << "✓ " << name << " PASSED\n";
+            pass++;
+        } else {
+            std::cout << "✗ " << name << " FAILED\n";
+            fail++;
+        }
+    };
+
+    // Long enough for the SIMD zero-copy string path
+    std::string long_text(100, 'a');
+    check("long string value", error_at_x("[\"" + long_text + "\" x]"));
+    check("long escaped string value", error_at_x("[\"" + long_text + "\\n\" x]"));
+    check("long string key", error_at_x("{\"" + long_text + "\": 1 x}"));
+    check("short string value", error_at_x(R"(["ab", x])"));
+
+    // Escaped keys fall back from the fast path to the scalar one
+    check("escaped key", error_at_x(R"({"a\"b": 1 x})"));
+    check("long escaped key", error_at_x("{\"" + long_text + "\\\"\": 1 x}"));
+    check("escaped key after fast key", error_at_x(R"({"ab": 1, "c\nd": 2 x})"));
+
+    std::cout << "\n" << pass << " passed, " << fail << " failed\n";
+    return (fail == 0) ? 0 : 1;
+}